@@ -0,0 +1,38 @@
+"""writing-agent — deterministic StoryPrompt → Script generator.
+
+Re-exports the public API from the canonical modules so callers never
+import a shadowed or duplicated definition.
+"""
+
+from writing_agent.compiler import (
+    CanonViolationError,
+    CompileError,
+    parse_story_file,
+    run_world_engine_validation,
+)
+from writing_agent.generator import generate_script
+from writing_agent.validator import (
+    StoryPrompt,
+    ValidationError,
+    validate_prompt,
+    validate_prompt_dict,
+    validate_prompt_msgpack,
+    validate_script_output,
+)
+from writing_agent.writer import write_json, write_msgpack
+
+__all__ = [
+    "CanonViolationError",
+    "CompileError",
+    "StoryPrompt",
+    "ValidationError",
+    "generate_script",
+    "parse_story_file",
+    "run_world_engine_validation",
+    "validate_prompt",
+    "validate_prompt_dict",
+    "validate_prompt_msgpack",
+    "validate_script_output",
+    "write_json",
+    "write_msgpack",
+]
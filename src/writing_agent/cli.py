@@ -11,8 +11,14 @@ import click
 
 from writing_agent.compiler import CanonViolationError, CompileError, parse_story_file, run_world_engine_validation
 from writing_agent.generator import generate_script
-from writing_agent.validator import ValidationError, validate_prompt, validate_prompt_dict, validate_script_output
-from writing_agent.writer import write_json
+from writing_agent.validator import (
+    ValidationError,
+    validate_prompt,
+    validate_prompt_dict,
+    validate_prompt_msgpack,
+    validate_script_output,
+)
+from writing_agent.writer import write_json, write_msgpack
 
 
 @click.group()
@@ -47,11 +53,20 @@ def main() -> None:
     default=False,
     help="Skip canon validation (standalone / dev mode)",
 )
+@click.option(
+    "--format",
+    "out_format",
+    type=click.Choice(["json", "msgpack"]),
+    default="json",
+    show_default=True,
+    help="Output encoding (msgpack is faster for machine-only pipelines)",
+)
 def compile_story(
     story_path: str,
     out_path: str,
     world_engine_cmd: str,
     skip_canon: bool,
+    out_format: str,
 ) -> None:
     """Compile a story text file into a validated StoryPrompt.json.
 
@@ -59,6 +74,28 @@ def compile_story(
     before being written to --out.  Use --skip-canon to bypass this gate (e.g.
     during development when world-engine is not installed).
     """
+    _do_compile(
+        story_path,
+        out_path,
+        world_engine_cmd=world_engine_cmd,
+        skip_canon=skip_canon,
+        out_format=out_format,
+    )
+
+
+def _do_compile(
+    story_path: str,
+    out_path: str,
+    *,
+    world_engine_cmd: str = "world-engine",
+    skip_canon: bool = False,
+    out_format: str = "json",
+) -> None:
+    """Implementation of `compile`, callable without going through Click.
+
+    Exits via sys.exit like the command itself; callers that want the exit
+    code catch SystemExit.
+    """
     # ── 1. Parse story text → prompt dict ────────────────────────────────────
     try:
         prompt_dict = parse_story_file(story_path)
@@ -74,8 +111,16 @@ def compile_story(
         sys.exit(1)
 
     # ── 3. Write to a temp file so world-engine can read it as a file ─────────
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
+    # The temp file lives next to the destination so the final replace is an
+    # atomic same-filesystem rename, not a copy across devices (mkstemp's
+    # default dir is typically a different filesystem than --out).
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=out.parent, prefix=f".{out.name}.", suffix=".tmp"
+    )
     os.close(tmp_fd)
+    moved = False
     try:
         write_json(prompt_dict, tmp_path)
 
@@ -95,16 +140,21 @@ def compile_story(
                 sys.exit(1)
 
         # ── 5. All checks passed — move to final destination ──────────────────
-        out = Path(out_path)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        Path(tmp_path).replace(out_path)
+        if out_format == "msgpack":
+            # world-engine reads JSON; only the final artifact is msgpack.
+            write_msgpack(prompt_dict, out_path)
+        else:
+            Path(tmp_path).replace(out)
+            moved = True
 
     finally:
-        # Clean up temp file if the replace above did not already remove it
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        # Clean up the temp file only on the failure paths; a successful
+        # replace already removed it.
+        if not moved:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     sys.exit(0)
 
@@ -124,10 +174,43 @@ def compile_story(
     type=click.Path(),
     help="Output path for Script.json",
 )
-def generate(prompt_path: str, out_path: str) -> None:
-    """Generate a Script.json from a StoryPrompt.json."""
+@click.option(
+    "--format",
+    "out_format",
+    type=click.Choice(["json", "msgpack"]),
+    default="json",
+    show_default=True,
+    help="Output encoding (msgpack is faster for machine-only pipelines)",
+)
+def generate(prompt_path: str, out_path: str, out_format: str) -> None:
+    """Generate a Script from a StoryPrompt.
+
+    The prompt encoding is detected from its first non-whitespace byte:
+    JSON documents start with '{', anything else is decoded as MessagePack
+    (as written by `compile --format msgpack`).
+    """
+    _do_generate(prompt_path, out_path, out_format=out_format)
+
+
+def _do_generate(prompt_path: str, out_path: str, *, out_format: str = "json") -> None:
+    """Implementation of `generate`, callable without going through Click.
+
+    Exits via sys.exit like the command itself; callers that want the exit
+    code catch SystemExit.
+    """
     try:
-        prompt = validate_prompt(prompt_path)
+        with open(prompt_path, "rb") as fh:
+            # JSON allows leading whitespace, so sniff the first
+            # non-whitespace byte rather than the literal first byte.
+            is_json = fh.read(64).lstrip().startswith(b"{")
+    except OSError:
+        is_json = True  # let validate_prompt surface the read error
+
+    try:
+        if is_json:
+            prompt = validate_prompt(prompt_path)
+        else:
+            prompt = validate_prompt_msgpack(prompt_path)
     except ValidationError:
         click.echo("ERROR: invalid StoryPrompt", err=True)
         sys.exit(1)
@@ -140,5 +223,8 @@ def generate(prompt_path: str, out_path: str) -> None:
         click.echo("ERROR: generated script violates contract", err=True)
         sys.exit(1)
 
-    write_json(script, out_path)
+    if out_format == "msgpack":
+        write_msgpack(script, out_path)
+    else:
+        write_json(script, out_path)
     sys.exit(0)
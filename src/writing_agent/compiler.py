@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -15,8 +19,10 @@ class CanonViolationError(Exception):
     """Raised when world-engine rejects the compiled StoryPrompt draft."""
 
 
-# All scalar directive keys (order defines error messages; not parse order)
-_SCALAR_FIELDS = (
+# All scalar directive keys (order defines error messages; not parse order).
+# Membership tests on the hot parse path use the frozenset; the ordered
+# tuple exists only for the missing-field error message.
+_SCALAR_FIELDS_ORDER = (
     "prompt_id",
     "episode_goal",
     "generation_seed",
@@ -26,6 +32,37 @@ _SCALAR_FIELDS = (
     "primary_location",
     "max_scenes",
 )
+_SCALAR_FIELDS = frozenset(_SCALAR_FIELDS_ORDER)
+
+# One directive per line: "key: value".  Parsed as raw bytes in a single
+# C-level sweep — directive keys are ASCII by construction, so the UTF-8
+# decode is deferred to the captured values only.  Blank and comment lines
+# are counted separately so unparseable lines can be detected without a
+# per-line Python loop.  Trailing \r keeps CRLF story files working now
+# that the universal-newline translation of read_text is gone.
+_DIRECTIVE_RE = re.compile(
+    rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+_IGNORED_LINE_RE = re.compile(rb"^[ \t]*(?:#[^\n]*)?\r?$", re.MULTILINE)
+
+
+def _lineno(raw: bytes, pos: int) -> int:
+    """1-based line number of byte offset *pos* (error paths only)."""
+    return raw.count(b"\n", 0, pos) + 1
+
+
+def _raise_unparseable_line(raw: bytes) -> None:
+    """Locate the first line that is neither a directive, blank, nor comment."""
+    for lineno, line in enumerate(raw.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith(b"#"):
+            continue
+        if not _DIRECTIVE_RE.fullmatch(line):
+            raise CompileError(
+                f"Line {lineno}: expected 'key: value',"
+                f" got: {stripped.decode('utf-8', errors='replace')!r}"
+            )
+    raise CompileError("Story file contains an unparseable line")
 
 
 def parse_story_file(path: str) -> dict:
@@ -50,47 +87,58 @@ def parse_story_file(path: str) -> dict:
     Raises CompileError on any parse or semantic problem.
     """
     try:
-        raw = Path(path).read_text(encoding="utf-8")
+        raw = Path(path).read_bytes()
     except OSError as exc:
         raise CompileError(f"Cannot read story file: {exc}") from exc
 
     fields: dict[str, str] = {}
     characters: list[dict[str, str]] = []
 
-    for lineno, line in enumerate(raw.splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        if ":" not in stripped:
+    n_directives = 0
+    for m in _DIRECTIVE_RE.finditer(raw):
+        n_directives += 1
+        key = m.group(1).decode("ascii").lower()
+        try:
+            value = m.group(2).decode("utf-8")
+        except UnicodeDecodeError as exc:
             raise CompileError(
-                f"Line {lineno}: expected 'key: value', got: {stripped!r}"
-            )
-
-        key, _, value = stripped.partition(":")
-        key = key.strip().lower()
-        value = value.strip()
+                f"Line {_lineno(raw, m.start())}: value for {key!r} is not"
+                f" valid UTF-8: {exc}"
+            ) from exc
 
         if key == "character":
             parts = value.split()
             if len(parts) < 2:
                 raise CompileError(
-                    f"Line {lineno}: 'character' requires '<id> <role>', got: {value!r}"
+                    f"Line {_lineno(raw, m.start())}: 'character' requires"
+                    f" '<id> <role>', got: {value!r}"
                 )
             characters.append({"id": parts[0], "role": " ".join(parts[1:])})
 
         elif key in _SCALAR_FIELDS:
             if key in fields:
-                raise CompileError(f"Line {lineno}: duplicate field {key!r}")
+                raise CompileError(
+                    f"Line {_lineno(raw, m.start())}: duplicate field {key!r}"
+                )
             if not value:
-                raise CompileError(f"Line {lineno}: field {key!r} must not be empty")
+                raise CompileError(
+                    f"Line {_lineno(raw, m.start())}: field {key!r} must not be empty"
+                )
             fields[key] = value
 
         else:
-            raise CompileError(f"Line {lineno}: unknown field {key!r}")
+            raise CompileError(
+                f"Line {_lineno(raw, m.start())}: unknown field {key!r}"
+            )
+
+    # Every line must be a directive, blank, or comment.  MULTILINE ^ sees
+    # raw.count(b"\n") + 1 line starts (including the empty "line" after a
+    # trailing newline, which _IGNORED_LINE_RE counts as ignored).
+    if n_directives + len(_IGNORED_LINE_RE.findall(raw)) != raw.count(b"\n") + 1:
+        _raise_unparseable_line(raw)
 
     # All scalar fields must be present
-    missing = [f for f in _SCALAR_FIELDS if f not in fields]
+    missing = [f for f in _SCALAR_FIELDS_ORDER if f not in fields]
     if missing:
         raise CompileError(f"Missing required field(s): {', '.join(missing)}")
 
@@ -136,6 +184,29 @@ def parse_story_file(path: str) -> dict:
     }
 
 
+def _canon_cache_dir() -> Path:
+    """Directory for the content-addressed canon validation cache."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "writing-agent" / "canon"
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_world_engine(cmd: str, path_env: str) -> str | None:
+    """Memoized shutil.which — keyed on $PATH so env changes invalidate."""
+    return shutil.which(cmd)
+
+
+def _world_engine_fingerprint(resolved_cmd: str) -> str:
+    """Cheap fingerprint of the world-engine binary (size + mtime).
+
+    A cached pass is only honoured while the binary is unchanged; replacing
+    or upgrading world-engine invalidates every entry automatically.
+    """
+    st = os.stat(resolved_cmd)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
 def run_world_engine_validation(prompt_path: str, world_engine_cmd: str) -> None:
     """Invoke world-engine to validate a compiled StoryPrompt file.
 
@@ -143,16 +214,35 @@ def run_world_engine_validation(prompt_path: str, world_engine_cmd: str) -> None
 
         <world_engine_cmd> validate-story-draft --prompt <prompt_path>
 
+    Successful validations are memoized in a content-addressed cache keyed
+    by the BLAKE2b digest of the prompt bytes, so re-compiling an unchanged
+    prompt (watch-mode dev, CI re-runs) skips the world-engine spawn
+    entirely.  Only passes are cached; violations are always re-checked.
+
     Raises:
         CompileError        — world-engine binary not found (caller should exit 2)
         CanonViolationError — world-engine rejected the prompt (caller should exit 1)
     """
-    if shutil.which(world_engine_cmd) is None:
+    resolved = _resolve_world_engine(world_engine_cmd, os.environ.get("PATH", ""))
+    if resolved is None:
         raise CompileError(
             f"world-engine not found: {world_engine_cmd!r}\n"
             "Install world-engine or use --skip-canon to bypass canon validation."
         )
 
+    # Cache lookups are best-effort: any cache I/O problem falls back to a
+    # normal world-engine run.
+    cache_entry = None
+    fingerprint = None
+    try:
+        digest = hashlib.blake2b(Path(prompt_path).read_bytes()).hexdigest()
+        fingerprint = _world_engine_fingerprint(resolved)
+        cache_entry = _canon_cache_dir() / digest
+        if cache_entry.read_text(encoding="utf-8") == fingerprint:
+            return
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             [world_engine_cmd, "validate-story-draft", "--prompt", prompt_path],
@@ -165,3 +255,10 @@ def run_world_engine_validation(prompt_path: str, world_engine_cmd: str) -> None
     if result.returncode != 0:
         detail = result.stderr.strip() or result.stdout.strip() or "(no output)"
         raise CanonViolationError(f"Canon validation failed:\n{detail}")
+
+    if cache_entry is not None and fingerprint is not None:
+        try:
+            cache_entry.parent.mkdir(parents=True, exist_ok=True)
+            cache_entry.write_text(fingerprint, encoding="utf-8")
+        except OSError:
+            pass
@@ -2,31 +2,44 @@
 
 from __future__ import annotations
 
+import re
 
-DIALOGUE_PAIRS = [
+from writing_agent.validator import StoryPrompt
+
+
+# Immutable so the constant (and its indexing) is safe to share across
+# calls; only speaker/line vary per generated action.
+DIALOGUE_PAIRS = (
     ("You came.", "I said I would."),
     ("We're late.", "Then we move now."),
     ("Did anyone follow you?", "No. But we shouldn't stay."),
-]
+)
+
+# Case-insensitive search without the per-call str.lower() copy.
+_NIGHT_RE = re.compile(r"night", re.IGNORECASE)
+
 
+def generate_script(prompt: StoryPrompt) -> dict:
+    """Generate a deterministic Script dict from a validated StoryPrompt.
 
-def generate_script(prompt: dict) -> dict:
-    """Generate a deterministic Script dict from a validated StoryPrompt dict."""
-    prompt_id        = prompt["prompt_id"]
-    episode_goal     = prompt["episode_goal"]
-    generation_seed  = prompt["generation_seed"]
-    series           = prompt["series"]
-    primary_location = prompt["setting"]["primary_location"]
-    characters       = prompt["characters"]
+    The returned dict is the writer boundary — it feeds straight into
+    validate_script_output and write_json.
+    """
+    prompt_id        = prompt.prompt_id
+    episode_goal     = prompt.episode_goal
+    generation_seed  = prompt.generation_seed
+    series           = prompt.series
+    primary_location = prompt.setting.primary_location
+    characters       = prompt.characters
 
     # time_of_day
-    time_of_day = "night" if "night" in primary_location.lower() else "day"
+    time_of_day = "night" if _NIGHT_RE.search(primary_location) else "day"
 
     # deterministic dialogue via seed
     line_a, line_b = DIALOGUE_PAIRS[generation_seed % 3]
     actions = [
-        {"type": "dialogue", "speaker": characters[0]["id"], "line": line_a},
-        {"type": "dialogue", "speaker": characters[1]["id"], "line": line_b},
+        {"type": "dialogue", "speaker": characters[0].id, "line": line_a},
+        {"type": "dialogue", "speaker": characters[1].id, "line": line_b},
     ]
 
     scene = {
@@ -37,8 +50,8 @@ def generate_script(prompt: dict) -> dict:
     }
 
     return {
-        "genre":          series["genre"],
-        "project_id":     series["title"],
+        "genre":          series.genre,
+        "project_id":     series.title,
         "schema_id":      "Script",
         "schema_version": "1.0.0",
         "scenes":         [scene],
@@ -2,116 +2,201 @@
 
 from __future__ import annotations
 
-import json
+import importlib.resources
+import operator
 from pathlib import Path
+from typing import Annotated
 
-import jsonschema
+import fastjsonschema
+import msgspec
+import orjson
 
-# Paths to contract schemas relative to this file:
-# src/writing_agent/ -> src/ -> repo root -> third_party/contracts/schemas/
-_CONTRACTS_SCHEMAS = (
-    Path(__file__).resolve().parents[2] / "third_party/contracts/schemas"
-)
-_STORY_PROMPT_SCHEMA_PATH = _CONTRACTS_SCHEMAS / "StoryPrompt.v1.json"
-_SCRIPT_SCHEMA_PATH = _CONTRACTS_SCHEMAS / "Script.v1.json"
+# Contract schemas ship inside the package (writing_agent/_schemas/ holds
+# byte-identical copies of the third_party/contracts versions), so loading
+# works from a wheel or zipapp without any repo-layout path traversal.
+_SCHEMAS = importlib.resources.files("writing_agent") / "_schemas"
+
+# Schemas are parsed and compiled once at import; validation is called per
+# document.  fastjsonschema generates a Python function specialized to each
+# schema, replacing jsonschema's generic tree-walking interpreter.
+_STORY_PROMPT_SCHEMA = orjson.loads((_SCHEMAS / "StoryPrompt.v1.json").read_bytes())
+_SCRIPT_SCHEMA = orjson.loads((_SCHEMAS / "Script.v1.json").read_bytes())
+_validate_prompt_schema = fastjsonschema.compile(_STORY_PROMPT_SCHEMA)
+_validate_script_schema = fastjsonschema.compile(_SCRIPT_SCHEMA)
 
 
 class ValidationError(Exception):
     """Raised when a StoryPrompt fails validation or a Script violates the contract."""
 
 
-def validate_prompt_dict(data: dict) -> dict:
+# ── Typed StoryPrompt model ───────────────────────────────────────────────────
+#
+# The structs mirror StoryPrompt.v1.json (required fields, no additional
+# properties, minLength/minItems/minimum constraints), so decoding a prompt
+# into them parses and contract-validates in a single C-level pass.
+# Constraints the schema cannot express (whitespace-only strings, the
+# schema_id literal) live in __post_init__ hooks.
+
+_NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+
+class Character(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    id: _NonEmptyStr
+    role: _NonEmptyStr
+
+    def __post_init__(self) -> None:
+        if not self.id.strip() or not self.role.strip():
+            raise msgspec.ValidationError(
+                "character 'id' and 'role' must be non-empty strings"
+            )
+
+
+class Series(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    genre: _NonEmptyStr
+    title: _NonEmptyStr
+    tone: _NonEmptyStr
+
+    def __post_init__(self) -> None:
+        for field in ("title", "genre", "tone"):
+            if not getattr(self, field).strip():
+                raise msgspec.ValidationError(
+                    f"'series.{field}' must be a non-empty string"
+                )
+
+
+class Setting(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    primary_location: _NonEmptyStr
+
+    def __post_init__(self) -> None:
+        if not self.primary_location.strip():
+            raise msgspec.ValidationError(
+                "'setting.primary_location' must be a non-empty string"
+            )
+
+
+class Constraints(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    max_scenes: Annotated[int, msgspec.Meta(ge=1)]
+
+
+class StoryPrompt(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    schema_id: _NonEmptyStr
+    schema_version: _NonEmptyStr
+    prompt_id: _NonEmptyStr
+    episode_goal: _NonEmptyStr
+    generation_seed: int
+    series: Series
+    setting: Setting
+    characters: Annotated[list[Character], msgspec.Meta(min_length=2)]
+    constraints: Constraints
+
+    def __post_init__(self) -> None:
+        if self.schema_id != "StoryPrompt":
+            raise msgspec.ValidationError("schema_id must be 'StoryPrompt'")
+        for field in ("schema_version", "prompt_id", "episode_goal"):
+            if not getattr(self, field).strip():
+                raise msgspec.ValidationError(
+                    f"'{field}' must be a non-empty string"
+                )
+
+
+_PROMPT_DECODER = msgspec.json.Decoder(StoryPrompt)
+_PROMPT_MSGPACK_DECODER = msgspec.msgpack.Decoder(StoryPrompt)
+
+# Bound once for the character-validation loop; one C-level call pulls both
+# fields instead of two dict.get lookups per character.
+_GET_ID_ROLE = operator.itemgetter("id", "role")
+
+
+def validate_prompt_dict(data: dict | StoryPrompt) -> dict | StoryPrompt:
     """Validate an in-memory StoryPrompt dict against the contract schema and semantic rules.
 
     Schema-level validation (StoryPrompt.v1.json) runs first.
     Semantic rules below catch constraints that JSON Schema cannot express.
 
+    A StoryPrompt struct short-circuits: the decoder already enforced the
+    contract and semantic rules when it was built.
+
     Returns *data* unchanged on success.
     Raises ValidationError on any problem.
     """
-    # 1. Schema validation against StoryPrompt.v1.json contract
-    schema = json.loads(_STORY_PROMPT_SCHEMA_PATH.read_text(encoding="utf-8"))
+    if isinstance(data, StoryPrompt):
+        return data
+
+    # 1. Schema validation against StoryPrompt.v1.json contract.  The schema
+    # already enforces the schema_id literal, required fields, string/integer
+    # types (booleans are rejected for integers), minLength on strings,
+    # minItems on characters, and max_scenes >= 1.
     try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as exc:
+        _validate_prompt_schema(data)
+    except fastjsonschema.JsonSchemaException as exc:
         raise ValidationError(f"StoryPrompt violates contract schema: {exc.message}") from exc
 
     # ── Semantic rules (constraints JSON Schema cannot express) ───────────────
+    # minLength catches "" but not whitespace-only strings; shapes and
+    # presence are guaranteed above, so direct indexing is safe here.
 
-    # 2. schema_id == "StoryPrompt"
-    if data.get("schema_id") != "StoryPrompt":
-        raise ValidationError("schema_id must be 'StoryPrompt'")
-
-    # 3. schema_version, prompt_id, episode_goal are non-empty strings
     for field in ("schema_version", "prompt_id", "episode_goal"):
-        v = data.get(field)
-        if not isinstance(v, str) or not v.strip():
+        if not data[field].strip():
             raise ValidationError(f"'{field}' must be a non-empty string")
 
-    # 4. generation_seed is not None
-    if data.get("generation_seed") is None:
-        raise ValidationError("'generation_seed' must not be None")
-
-    # 5. series.{title,genre,tone} are non-empty strings
-    series = data.get("series")
-    if not isinstance(series, dict):
-        raise ValidationError("'series' must be a JSON object")
+    series = data["series"]
     for field in ("title", "genre", "tone"):
-        v = series.get(field)
-        if not isinstance(v, str) or not v.strip():
+        if not series[field].strip():
             raise ValidationError(f"'series.{field}' must be a non-empty string")
 
-    # 6. setting.primary_location is a non-empty string
-    setting = data.get("setting")
-    if not isinstance(setting, dict):
-        raise ValidationError("'setting' must be a JSON object")
-    primary_location = setting.get("primary_location")
-    if not isinstance(primary_location, str) or not primary_location.strip():
+    if not data["setting"]["primary_location"].strip():
         raise ValidationError("'setting.primary_location' must be a non-empty string")
 
-    # 7. characters is a non-empty list; each item has non-empty id and role strings
-    characters = data.get("characters")
-    if not isinstance(characters, list) or len(characters) < 2:
-        raise ValidationError("'characters' must be a list with at least 2 entries")
-    for i, char in enumerate(characters):
-        if not isinstance(char, dict):
-            raise ValidationError(f"characters[{i}] must be a JSON object")
-        for field in ("id", "role"):
-            v = char.get(field)
-            if not isinstance(v, str) or not v.strip():
-                raise ValidationError(
-                    f"characters[{i}].{field} must be a non-empty string"
-                )
-
-    # 8. constraints.max_scenes is a positive int (reject booleans)
-    constraints = data.get("constraints")
-    if not isinstance(constraints, dict):
-        raise ValidationError("'constraints' must be a JSON object")
-    max_scenes = constraints.get("max_scenes")
-    if isinstance(max_scenes, bool) or not isinstance(max_scenes, int) or max_scenes <= 0:
-        raise ValidationError("'constraints.max_scenes' must be a positive integer")
+    for i, char in enumerate(data["characters"]):
+        cid, crole = _GET_ID_ROLE(char)
+        if not cid.strip():
+            raise ValidationError(f"characters[{i}].id must be a non-empty string")
+        if not crole.strip():
+            raise ValidationError(f"characters[{i}].role must be a non-empty string")
 
     return data
 
 
-def validate_prompt(path: str) -> dict:
-    """Read a StoryPrompt JSON file, then validate it via validate_prompt_dict.
+def validate_prompt(path: str) -> StoryPrompt:
+    """Read a StoryPrompt JSON file and decode it into a validated StoryPrompt.
+
+    Parsing and validation happen in a single msgspec decode pass; the
+    structs above encode the same constraints as the contract schema plus
+    the semantic rules.
 
-    Returns the parsed prompt dict on success.
+    Returns the decoded StoryPrompt struct on success.
     Raises ValidationError on any problem.
     """
-    # 1. File is readable and valid JSON
     try:
-        raw = Path(path).read_text(encoding="utf-8")
+        raw = Path(path).read_bytes()
     except OSError as exc:
         raise ValidationError(f"Cannot read file: {exc}") from exc
 
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        return _PROMPT_DECODER.decode(raw)
+    except msgspec.ValidationError as exc:
+        raise ValidationError(f"StoryPrompt violates contract schema: {exc}") from exc
+    except msgspec.DecodeError as exc:
         raise ValidationError(f"Invalid JSON: {exc}") from exc
 
-    return validate_prompt_dict(data)
+
+def validate_prompt_msgpack(path: str) -> StoryPrompt:
+    """validate_prompt for MessagePack-encoded prompts (see write_msgpack).
+
+    Returns the decoded StoryPrompt struct on success.
+    Raises ValidationError on any problem.
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except OSError as exc:
+        raise ValidationError(f"Cannot read file: {exc}") from exc
+
+    try:
+        return _PROMPT_MSGPACK_DECODER.decode(raw)
+    except msgspec.ValidationError as exc:
+        raise ValidationError(f"StoryPrompt violates contract schema: {exc}") from exc
+    except msgspec.DecodeError as exc:
+        raise ValidationError(f"Invalid MessagePack: {exc}") from exc
 
 
 def validate_script_output(script: dict) -> None:
@@ -119,8 +204,7 @@ def validate_script_output(script: dict) -> None:
 
     Raises ValidationError if the script violates the schema.
     """
-    schema = json.loads(_SCRIPT_SCHEMA_PATH.read_text(encoding="utf-8"))
     try:
-        jsonschema.validate(script, schema)
-    except jsonschema.ValidationError as exc:
+        _validate_script_schema(script)
+    except fastjsonschema.JsonSchemaException as exc:
         raise ValidationError(f"Script output violates contract: {exc.message}") from exc
@@ -1,21 +1,49 @@
-"""Byte-stable JSON output writer."""
+"""Byte-stable JSON and MessagePack output writers."""
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import msgspec
+import orjson
+
 
 def write_json(data: dict, path: str) -> None:
     """Write *data* to *path* as byte-stable, POSIX-compliant JSON.
 
     Guarantees:
-    - sort_keys=True  → eliminates dict ordering non-determinism
-    - ensure_ascii=True → no locale-dependent unicode variation
-    - newline="\\n"   → Unix line endings everywhere
+    - OPT_SORT_KEYS   → eliminates dict ordering non-determinism
+    - 2-space indent, Unix line endings, UTF-8 — byte-identical to the
+      stdlib ``json.dumps(sort_keys=True, indent=2)`` format for ASCII data
     - Single trailing "\\n" → POSIX-compliant text file
     """
-    serialized = json.dumps(data, sort_keys=True, indent=2, ensure_ascii=True)
+    serialized = orjson.dumps(
+        data,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+    )
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(serialized)
+
+
+def _sort_keys_deep(obj: object) -> object:
+    """Return *obj* with every nested dict rebuilt in sorted key order."""
+    if isinstance(obj, dict):
+        return {k: _sort_keys_deep(obj[k]) for k in sorted(obj)}
+    if isinstance(obj, list):
+        return [_sort_keys_deep(v) for v in obj]
+    return obj
+
+
+def write_msgpack(data: dict, path: str) -> None:
+    """Write *data* to *path* as byte-stable MessagePack.
+
+    Intended for machine-to-machine intermediates (StoryPrompt/Script
+    passed between pipeline stages); JSON stays the default for human
+    diffability.  Keys are sorted recursively before encoding so the
+    output is byte-stable like write_json's.
+    """
+    payload = msgspec.msgpack.encode(_sort_keys_deep(data))
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(serialized + "\n", encoding="utf-8", newline="\n")
+    out.write_bytes(payload)
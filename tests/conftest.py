@@ -2,10 +2,160 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
 
+import jsonschema
+import orjson
 import pytest
+from click.testing import CliRunner
+
+from writing_agent.cli import main
+
+_TESTS_DIR = Path(__file__).resolve().parent
+_SCHEMAS_DIR = _TESTS_DIR.parent / "third_party/contracts/schemas"
+_STUBS_DIR = _TESTS_DIR / "stubs"
+
+# Canonical minimal story as structured data; tests mutate the dict (drop a
+# key, override a value) and render, instead of doing string surgery on the
+# rendered text.
+MINIMAL_FIELDS = {
+    "prompt_id": "ep001",
+    "episode_goal": "Find the hidden treasure",
+    "generation_seed": 42,
+    "series_title": "Western Tales",
+    "series_genre": "Western",
+    "series_tone": "Adventurous",
+    "primary_location": "Old West Town",
+    "max_scenes": 3,
+}
+MINIMAL_CHARACTERS = (("sheriff", "protagonist"), ("bandit", "antagonist"))
+
+
+def render_story(fields: dict, characters=MINIMAL_CHARACTERS) -> str:
+    """Render a story-text document from scalar fields and character pairs."""
+    lines = [f"{key}: {value}" for key, value in fields.items()]
+    lines.extend(f"character: {cid} {role}" for cid, role in characters)
+    return "\n".join(lines) + "\n"
+
+
+# Rendered once; compiled once per session by compiled_minimal.
+MINIMAL_STORY = render_story(MINIMAL_FIELDS)
+
+
+def file_sha256(p: Path) -> str:
+    """Streaming sha256 of a file; determinism tests compare digests so the
+    full byte blobs never sit in the assertion frame."""
+    with open(p, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def load_json(p: Path) -> dict:
+    """Parse a JSON file via orjson, skipping the bytes→str decode round."""
+    return orjson.loads(Path(p).read_bytes())
+
+
+def run_cli(func, /, *args, **kwargs) -> int:
+    """Call a CLI implementation function (_do_compile / _do_generate) directly.
+
+    The implementation functions exit via sys.exit; this catches SystemExit
+    and returns the exit code, skipping CliRunner's isolation machinery for
+    tests that only care about behavior, not argument parsing.
+    """
+    try:
+        func(*args, **kwargs)
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    return 0
+
+
+@lru_cache(maxsize=None)
+def _compiled_validator(schema_filename: str):
+    """Build (once) a checked jsonschema validator for a contract schema."""
+    schema = orjson.loads((_SCHEMAS_DIR / schema_filename).read_bytes())
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm() -> None:
+    """Pay the cold-import and metaschema-load cost before the first test.
+
+    Whichever test runs first would otherwise absorb the jsonschema/click
+    import graph and the Draft7 metaschema load into its own timing.
+    """
+    import click  # noqa: F401
+
+    import writing_agent.cli  # noqa: F401
+
+    jsonschema.Draft7Validator.check_schema({"type": "object"})
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared CliRunner — invoke() is stateless between calls, so one
+    instance serves the whole session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def compiled_minimal(tmp_path_factory, runner) -> dict:
+    """Compile MINIMAL_STORY once per session and share the result.
+
+    Returns {"story": Path, "sha256": ..., "data": ..., "output": ...} so the
+    positive compile tests can assert without re-running the pipeline.  This
+    is also the one place the compile command goes through CliRunner, keeping
+    argument-parsing coverage while everything else calls _do_compile.
+    """
+    d = tmp_path_factory.mktemp("compiled")
+    story = d / "story.txt"
+    story.write_text(MINIMAL_STORY, encoding="utf-8")
+    out = d / "prompt.json"
+    res = runner.invoke(
+        main, ["compile", "--story", str(story), "--out", str(out), "--skip-canon"]
+    )
+    assert res.exit_code == 0, f"session compile failed: {res.output}"
+    raw = out.read_bytes()
+    return {
+        "story": story,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "data": orjson.loads(raw),
+        "output": res.output,
+    }
+
+
+@pytest.fixture(scope="session")
+def stubs() -> dict[str, str]:
+    """world-engine stub paths, probed once per session.
+
+    If the committed stubs are missing or not executable, every dependent
+    test would pay a spawn-and-fail cycle; skipping here short-circuits all
+    of them with a single os.access check each.
+    """
+    paths = {
+        "pass": str(_STUBS_DIR / "world_engine_pass.sh"),
+        "fail": str(_STUBS_DIR / "world_engine_fail.sh"),
+        "missing": "/nonexistent/world-engine",
+    }
+    for key in ("pass", "fail"):
+        if not os.access(paths[key], os.X_OK):
+            pytest.skip(f"world-engine stub not executable: {paths[key]}")
+    return paths
+
+
+@pytest.fixture(scope="session")
+def story_validator():
+    """Compiled validator for StoryPrompt.v1.json, built once per run."""
+    return _compiled_validator("StoryPrompt.v1.json")
+
+
+@pytest.fixture(scope="session")
+def script_validator():
+    """Compiled validator for Script.v1.json, built once per run."""
+    return _compiled_validator("Script.v1.json")
 
 
 @pytest.fixture()
@@ -43,7 +193,7 @@ def prompt_file(tmp_path: Path):
     def _make(data: dict) -> Path:
         counter["n"] += 1
         p = tmp_path / f"prompt_{counter['n']}.json"
-        p.write_text(json.dumps(data), encoding="utf-8")
+        p.write_bytes(orjson.dumps(data))
         return p
 
     return _make
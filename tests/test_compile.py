@@ -2,40 +2,32 @@
 
 from __future__ import annotations
 
-import json
+from functools import partial
 from pathlib import Path
 
-import jsonschema
 import pytest
-from click.testing import CliRunner
 
-from writing_agent.cli import main
+from writing_agent.cli import _do_compile, _do_generate
 
-# Path helpers
-_REPO_ROOT = Path(__file__).resolve().parents[1]
-_SCHEMA_PATH = _REPO_ROOT / "third_party/contracts/schemas/StoryPrompt.v1.json"
-_STUBS_DIR   = Path(__file__).resolve().parent / "stubs"
+from tests.conftest import file_sha256, load_json, run_cli
 
-_STUB_PASS = str(_STUBS_DIR / "world_engine_pass.sh")
-_STUB_FAIL = str(_STUBS_DIR / "world_engine_fail.sh")
-_STUB_MISSING = "/nonexistent/world-engine"
+# Path helpers — resolved once at import; stub paths come from the session
+# scoped `stubs` fixture in conftest.
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_EXAMPLE_STORY = _REPO_ROOT / "tests/examples/StoryPrompt.minimal.story"
 
 # ---------------------------------------------------------------------------
 # Shared story text fixture
 # ---------------------------------------------------------------------------
 
-_MINIMAL_STORY = """\
-prompt_id:        ep001
-episode_goal:     Find the hidden treasure
-generation_seed:  42
-series_title:     Western Tales
-series_genre:     Western
-series_tone:      Adventurous
-primary_location: Old West Town
-max_scenes:       3
-character:        sheriff protagonist
-character:        bandit antagonist
-"""
+# The canonical story lives in conftest so the session-scoped
+# compiled_minimal fixture and the mutation tests below share one source.
+from tests.conftest import (
+    MINIMAL_CHARACTERS,
+    MINIMAL_FIELDS,
+    MINIMAL_STORY as _MINIMAL_STORY,
+    render_story,
+)
 
 
 @pytest.fixture()
@@ -52,23 +44,9 @@ def story_file(tmp_path):
 # Test 1 — Valid story produces a valid StoryPrompt.json (canon skipped)
 # ---------------------------------------------------------------------------
 
-def test_compile_valid_story_skip_canon(story_file, tmp_path):
+def test_compile_valid_story_skip_canon(compiled_minimal):
     """A well-formed story file compiles to a valid StoryPrompt.json."""
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        [
-            "compile",
-            "--story", str(story_file()),
-            "--out",   str(out),
-            "--skip-canon",
-        ],
-    )
-    assert result.exit_code == 0, f"compile failed: {result.output}"
-    assert out.exists(), "Output file was not created"
-
-    data = json.loads(out.read_text(encoding="utf-8"))
+    data = compiled_minimal["data"]
     assert data["schema_id"]      == "StoryPrompt"
     assert data["prompt_id"]      == "ep001"
     assert data["episode_goal"]   == "Find the hidden treasure"
@@ -87,156 +65,71 @@ def test_compile_valid_story_skip_canon(story_file, tmp_path):
 # Test 2 — Output conforms to StoryPrompt.v1.json contract schema
 # ---------------------------------------------------------------------------
 
-def test_compile_output_conforms_to_schema(story_file, tmp_path):
+def test_compile_output_conforms_to_schema(compiled_minimal, story_validator):
     """Compiled StoryPrompt.json must validate against StoryPrompt.v1.json."""
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(story_file()), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 0, f"compile failed: {result.output}"
-
-    data   = json.loads(out.read_text(encoding="utf-8"))
-    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
-    jsonschema.validate(data, schema)  # raises if invalid
+    story_validator.validate(compiled_minimal["data"])  # raises if invalid
 
 
 # ---------------------------------------------------------------------------
 # Test 3 — Output is byte-identical across two runs (deterministic)
 # ---------------------------------------------------------------------------
 
-def test_compile_deterministic(story_file, tmp_path):
+def test_compile_deterministic(compiled_minimal, tmp_path):
     """Compiling the same story twice produces byte-identical output."""
-    runner = CliRunner()
-    story = story_file()
-    out1  = tmp_path / "prompt1.json"
-    out2  = tmp_path / "prompt2.json"
-
-    r1 = runner.invoke(main, ["compile", "--story", str(story), "--out", str(out1), "--skip-canon"])
-    r2 = runner.invoke(main, ["compile", "--story", str(story), "--out", str(out2), "--skip-canon"])
-
-    assert r1.exit_code == 0
-    assert r2.exit_code == 0
-    assert out1.read_bytes() == out2.read_bytes(), "Outputs are not byte-identical"
+    out = tmp_path / "prompt2.json"
+    rc = run_cli(_do_compile, str(compiled_minimal["story"]), str(out), skip_canon=True)
+    assert rc == 0
+    assert file_sha256(out) == compiled_minimal["sha256"], "Outputs are not byte-identical"
 
 
 # ---------------------------------------------------------------------------
-# Test 4 — Missing required field → exit 1
+# Tests 4–7 — Invalid story text → exit 1, no output file
 # ---------------------------------------------------------------------------
 
-@pytest.mark.parametrize("missing_field,replacement", [
-    ("prompt_id:",        ""),
-    ("episode_goal:",     ""),
-    ("generation_seed:",  ""),
-    ("series_title:",     ""),
-    ("series_genre:",     ""),
-    ("series_tone:",      ""),
-    ("primary_location:", ""),
-    ("max_scenes:",       ""),
-])
-def test_compile_missing_field(story_file, tmp_path, missing_field, replacement):
-    """A story file missing any required field must fail with exit code 1."""
-    story = _MINIMAL_STORY
-    # Drop the line that contains the field key
-    lines = [ln for ln in story.splitlines() if not ln.strip().startswith(missing_field.rstrip(":"))]
-    broken = "\n".join(lines)
-
-    p = tmp_path / "broken.txt"
-    p.write_text(broken, encoding="utf-8")
-
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(p), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 1, f"Expected exit 1 for missing {missing_field!r}"
-    assert not out.exists(), "Output file must not be written on failure"
-
-
-# ---------------------------------------------------------------------------
-# Test 5 — Fewer than 2 characters → exit 1
-# ---------------------------------------------------------------------------
+def _story(characters=MINIMAL_CHARACTERS, drop=None, **overrides) -> str:
+    """Render MINIMAL_FIELDS with one key dropped and/or values overridden."""
+    fields = {**MINIMAL_FIELDS, **overrides}
+    if drop is not None:
+        del fields[drop]
+    return render_story(fields, characters)
 
-def test_compile_too_few_characters(story_file, tmp_path):
-    """A story with only 1 character must fail."""
-    story = "\n".join(
-        ln for ln in _MINIMAL_STORY.splitlines()
-        if not ln.strip().startswith("character:")
-    ) + "\ncharacter: sheriff protagonist\n"
 
-    p = tmp_path / "one_char.txt"
-    p.write_text(story, encoding="utf-8")
+# (id, make_story) pairs: each case renders a story broken in one way that
+# compile must reject with exit code 1.
+INVALID_CASES = [
+    *((f"missing_{key}", partial(_story, drop=key)) for key in MINIMAL_FIELDS),
+    ("bad_seed", partial(_story, generation_seed="notanint")),
+    ("max_scenes_zero", partial(_story, max_scenes=0)),
+    ("one_character", partial(_story, characters=MINIMAL_CHARACTERS[:1])),
+]
 
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(p), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 1
-    assert not out.exists()
-
-
-# ---------------------------------------------------------------------------
-# Test 6 — Non-integer generation_seed → exit 1
-# ---------------------------------------------------------------------------
 
-def test_compile_invalid_seed(story_file, tmp_path):
-    """A non-integer generation_seed must fail."""
-    story = _MINIMAL_STORY.replace("generation_seed:  42", "generation_seed:  notanint")
-    p = tmp_path / "bad_seed.txt"
-    p.write_text(story, encoding="utf-8")
+@pytest.mark.parametrize(
+    "make_story", [c for _, c in INVALID_CASES], ids=[i for i, _ in INVALID_CASES]
+)
+def test_compile_invalid_story(tmp_path, make_story):
+    """Any invalid story text must fail with exit code 1 and write no output."""
+    p = tmp_path / "invalid.txt"
+    p.write_text(make_story(), encoding="utf-8")
 
-    runner = CliRunner()
     out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(p), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 1
-    assert not out.exists()
-
-
-# ---------------------------------------------------------------------------
-# Test 7 — max_scenes = 0 → exit 1
-# ---------------------------------------------------------------------------
-
-def test_compile_max_scenes_zero(story_file, tmp_path):
-    """max_scenes must be a positive integer."""
-    story = _MINIMAL_STORY.replace("max_scenes:       3", "max_scenes:       0")
-    p = tmp_path / "zero_scenes.txt"
-    p.write_text(story, encoding="utf-8")
-
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(p), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 1
-    assert not out.exists()
+    rc = run_cli(_do_compile, str(p), str(out), skip_canon=True)
+    assert rc == 1, f"Expected exit 1, got {rc}"
+    assert not out.exists(), "Output file must not be written on failure"
 
 
 # ---------------------------------------------------------------------------
 # Test 8 — world-engine not found → exit 2, no output file
 # ---------------------------------------------------------------------------
 
-def test_compile_world_engine_not_found(story_file, tmp_path):
+@pytest.mark.slow
+def test_compile_world_engine_not_found(story_file, tmp_path, stubs):
     """When world-engine binary is missing, compile must exit 2."""
-    runner = CliRunner()
     out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        [
-            "compile",
-            "--story",            str(story_file()),
-            "--out",              str(out),
-            "--world-engine-cmd", _STUB_MISSING,
-        ],
+    rc = run_cli(
+        _do_compile, str(story_file()), str(out), world_engine_cmd=stubs["missing"]
     )
-    assert result.exit_code == 2, f"Expected exit 2, got {result.exit_code}"
+    assert rc == 2, f"Expected exit 2, got {rc}"
     assert not out.exists(), "Output file must not be written when world-engine is missing"
 
 
@@ -244,20 +137,14 @@ def test_compile_world_engine_not_found(story_file, tmp_path):
 # Test 9 — world-engine returns violation → exit 1, no output file
 # ---------------------------------------------------------------------------
 
-def test_compile_world_engine_canon_violation(story_file, tmp_path):
+@pytest.mark.slow
+def test_compile_world_engine_canon_violation(story_file, tmp_path, stubs):
     """When world-engine signals a canon violation, compile must exit 1."""
-    runner = CliRunner()
     out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        [
-            "compile",
-            "--story",            str(story_file()),
-            "--out",              str(out),
-            "--world-engine-cmd", _STUB_FAIL,
-        ],
+    rc = run_cli(
+        _do_compile, str(story_file()), str(out), world_engine_cmd=stubs["fail"]
     )
-    assert result.exit_code == 1, f"Expected exit 1, got {result.exit_code}"
+    assert rc == 1, f"Expected exit 1, got {rc}"
     assert not out.exists(), "Output file must not be written on canon violation"
 
 
@@ -265,23 +152,17 @@ def test_compile_world_engine_canon_violation(story_file, tmp_path):
 # Test 10 — world-engine passes → exit 0, output file written
 # ---------------------------------------------------------------------------
 
-def test_compile_world_engine_passes(story_file, tmp_path):
+@pytest.mark.slow
+def test_compile_world_engine_passes(story_file, tmp_path, stubs):
     """When world-engine signals success, compile must exit 0 and write output."""
-    runner = CliRunner()
     out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        [
-            "compile",
-            "--story",            str(story_file()),
-            "--out",              str(out),
-            "--world-engine-cmd", _STUB_PASS,
-        ],
+    rc = run_cli(
+        _do_compile, str(story_file()), str(out), world_engine_cmd=stubs["pass"]
     )
-    assert result.exit_code == 0, f"compile failed: {result.output}"
+    assert rc == 0, f"compile failed with exit code {rc}"
     assert out.exists(), "Output file must be written on success"
 
-    data = json.loads(out.read_text(encoding="utf-8"))
+    data = load_json(out)
     assert data["schema_id"] == "StoryPrompt"
 
 
@@ -289,38 +170,47 @@ def test_compile_world_engine_passes(story_file, tmp_path):
 # Test 11 — --skip-canon emits warning but still succeeds
 # ---------------------------------------------------------------------------
 
-def test_compile_skip_canon_emits_warning(story_file, tmp_path):
+def test_compile_skip_canon_emits_warning(compiled_minimal):
     """--skip-canon must emit a warning and still produce output."""
-    runner = CliRunner()
-    out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(story_file()), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 0
-    assert out.exists()
     # CliRunner mixes stderr into output; check the combined stream
-    assert "WARNING" in result.output, "Expected WARNING in output"
-    assert "skip-canon" in result.output.lower()
+    assert "WARNING" in compiled_minimal["output"], "Expected WARNING in output"
+    assert "skip-canon" in compiled_minimal["output"].lower()
+
+
+# ---------------------------------------------------------------------------
+# MessagePack output — decodes to the same prompt and feeds generate
+# ---------------------------------------------------------------------------
+
+def test_compile_msgpack_round_trip(story_file, tmp_path, story_validator):
+    """--format msgpack writes a prompt that generate consumes directly."""
+    import msgspec
+
+    out = tmp_path / "prompt.msgpack"
+    rc = run_cli(
+        _do_compile, str(story_file()), str(out), skip_canon=True, out_format="msgpack"
+    )
+    assert rc == 0, f"compile failed with exit code {rc}"
+
+    data = msgspec.msgpack.decode(out.read_bytes())
+    story_validator.validate(data)  # raises if invalid
+
+    script_out = tmp_path / "script.json"
+    rc = run_cli(_do_generate, str(out), str(script_out))
+    assert rc == 0, f"generate from msgpack failed with exit code {rc}"
+    assert load_json(script_out)["schema_id"] == "Script"
 
 
 # ---------------------------------------------------------------------------
 # Test 12 — Example story file round-trips cleanly
 # ---------------------------------------------------------------------------
 
-def test_compile_example_story_file(tmp_path):
+def test_compile_example_story_file(tmp_path, story_validator):
     """The committed example story file compiles to a valid StoryPrompt.json."""
-    example = _REPO_ROOT / "tests/examples/StoryPrompt.minimal.story"
-    assert example.exists(), f"Example story file not found: {example}"
+    assert _EXAMPLE_STORY.exists(), f"Example story file not found: {_EXAMPLE_STORY}"
 
-    runner = CliRunner()
     out = tmp_path / "prompt.json"
-    result = runner.invoke(
-        main,
-        ["compile", "--story", str(example), "--out", str(out), "--skip-canon"],
-    )
-    assert result.exit_code == 0, f"compile failed: {result.output}"
+    rc = run_cli(_do_compile, str(_EXAMPLE_STORY), str(out), skip_canon=True)
+    assert rc == 0, f"compile failed with exit code {rc}"
 
-    data   = json.loads(out.read_text(encoding="utf-8"))
-    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
-    jsonschema.validate(data, schema)
+    data = load_json(out)
+    story_validator.validate(data)
@@ -0,0 +1,48 @@
+"""Tests for the contracts verification tool (third_party/contracts/tools)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+# The tool is a standalone script outside the installed package; import it
+# straight from its directory.
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[1] / "third_party/contracts/tools")
+)
+
+import verify_contracts
+
+
+# ---------------------------------------------------------------------------
+# canonical_bytes — byte format is locked to the stdlib definition
+# ---------------------------------------------------------------------------
+
+def test_canonical_bytes_matches_stdlib_definition():
+    """canonical_bytes must equal json.dumps(sort_keys, compact) + newline.
+
+    Exercises the spots where serializers disagree: non-ASCII text
+    (ensure_ascii escapes vs raw UTF-8) and large floats (1e+16 vs 1e16).
+    """
+    data = {
+        "b": [1, 2.5, 1e16],
+        "a": {"name": "café", "path": "x/y"},
+        "n": None,
+    }
+    expected = (
+        json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+    got = verify_contracts.canonical_bytes(data)
+    assert got == expected
+    assert b"caf\\u00e9" in got, "non-ASCII text must be ensure_ascii-escaped"
+    assert b"1e+16" in got, "float exponents must use the stdlib '+' style"
+
+
+def test_check_canonical_verdict_is_serializer_independent():
+    """A stdlib-canonical golden must pass regardless of installed serializers."""
+    raw = b'{"name":"caf\\u00e9","x":1e+16}\n'
+    errors, data = verify_contracts.check_canonical(raw, "golden.json")
+    assert errors == [], f"Canonical content rejected: {errors}"
+    assert data == {"name": "café", "x": 1e16}
@@ -9,13 +9,31 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import jsonschema
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional accelerator
+    fastjsonschema = None
+
+# orjson parses straight from bytes in C; the stdlib decodes the same input
+# a few times slower but with identical results (orjson.JSONDecodeError is
+# a json.JSONDecodeError subclass, so one except clause covers both).
+_loads = json.loads if orjson is None else orjson.loads
+
 # Default contracts dir is parent of this file's parent (i.e., contracts/)
 CONTRACTS_DIR = Path(__file__).parent.parent
 
@@ -32,130 +50,466 @@ SCHEMA_MAP: dict[str, str] = {
     "EpisodeBundle": "EpisodeBundle.v1.json",
 }
 
-_RE_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 _EPOCH_SENTINEL = "1970-01-01T00:00:00Z"
+# Explicitly allow file:///placeholder and file:///placeholder/... only; any
+# other file:// URI (e.g. file:///tmp, file:///home, file:///prod) is flagged.
+# Checked with startswith/indexing in _check_string_value — prefix tests on
+# short strings are several times cheaper in C than an anchored regex.
+# The first character decides which (single) pattern can possibly apply:
+# digits → datetime or UUID, a–f hex → UUID or file URI, '/' or an
+# uppercase drive letter → absolute path.  Anything else is clean after one
+# comparison, so the regex engine only runs on plausible candidates.
+_RE_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 _RE_UUID = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
 )
-# Explicitly allow file:///placeholder and file:///placeholder/... only.
-# Any other file:// URI (e.g. file:///tmp, file:///home, file:///prod) is flagged.
-_RE_FILE_URI_ALLOWED = re.compile(r"^file:///placeholder(/|$)")
-_RE_FILE_URI = re.compile(r"^file:///")
-_RE_ABS_PATH = re.compile(r"^/[a-z]|^[A-Z]:\\")
+# Candidate prefilter run once over a file's canonical bytes: if nothing in
+# the blob even resembles a violation, the per-value walk is skipped.  Only
+# sound on canonical content, where the serializer never escape-encodes
+# digits, slashes, or colons (all ASCII), so every pattern appears
+# literally.  Deliberately a superset (it matches mid-string too); the walk
+# stays the precise judge.
+_RE_BLOB_CANDIDATES = re.compile(
+    rb"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+    rb"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    rb"|file:///"
+    rb'|"/[a-z]'
+    rb'|"[A-Z]:\\\\'
+)
+
+# Validator per schema filename, built on first use.  Only a handful of
+# schemas exist, so caching turns validator construction (meta-schema check,
+# ref resolution) from per-golden into per-schema work.  Each entry is a
+# callable(data) -> list of error messages, keyed by (filename, all_errors).
+_VALIDATOR_CACHE: dict[tuple[str, bool], object] = {}
+
+# Resolved schema path (or None when the file is missing), keyed by
+# (schemas_dir, schema filename): one join and one stat per schema per
+# process instead of per golden.
+_SCHEMA_PATH_CACHE: dict[tuple[str, str], Path | None] = {}
+
+# fastjsonschema codegen source persisted across runs in
+# contracts/.validator_cache.json, keyed by the sha256 of the schema file
+# bytes so entries age out when a schema changes.  Warm runs exec the cached
+# source instead of re-running the code generator.  One mapping per cache
+# file, loaded lazily; best-effort on both read and write.
+_CODE_CACHE: dict[str, dict[str, str]] = {}
+
+
+def _load_code_cache(cache_path: Path) -> dict[str, str]:
+    """Return the in-process mapping for *cache_path*, reading it on first use."""
+    key = str(cache_path)
+    try:
+        return _CODE_CACHE[key]
+    except KeyError:
+        try:
+            cache = _loads(cache_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        _CODE_CACHE[key] = cache
+        return cache
+
+
+def _store_code_cache(cache_path: Path) -> None:
+    """Rewrite *cache_path* from the in-process mapping (atomic via rename)."""
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        tmp_path.write_bytes(canonical_bytes(_CODE_CACHE[str(cache_path)]))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # read-only checkout; the cache is purely an accelerator
+
+
+def _build_validator(schema_path: Path, all_errors: bool = False):
+    """Build a validation callable for one schema file.
+
+    Prefers a fastjsonschema-compiled function (codegen, much faster than the
+    tree-walking interpreter); falls back to jsonschema for schemas it cannot
+    compile or when fastjsonschema is not installed.  By default the
+    jsonschema fallback aborts on the first error; *all_errors* restores the
+    exhaustive iter_errors pass (first three messages).  The fastjsonschema
+    path always reports a single error.
+    """
+    raw = schema_path.read_bytes()
+    schema = _loads(raw)
+
+    if fastjsonschema is not None:
+        cache_path = schema_path.parent.parent / ".validator_cache.json"
+        cache = _load_code_cache(cache_path)
+        digest = hashlib.sha256(raw).hexdigest()
+
+        compiled = None
+        code = cache.get(digest)
+        if code is not None:
+            try:
+                namespace: dict = {}
+                exec(compile(code, str(schema_path), "exec"), namespace)
+                compiled = namespace["validate"]
+            except Exception:  # noqa: BLE001 - corrupt entry; regenerate below
+                del cache[digest]
+        if compiled is None:
+            try:
+                code = fastjsonschema.compile_to_code(schema)
+                namespace = {}
+                exec(compile(code, str(schema_path), "exec"), namespace)
+                compiled = namespace["validate"]
+            except Exception:  # noqa: BLE001 - unsupported construct; use jsonschema
+                compiled = None
+            else:
+                cache[digest] = code
+                _store_code_cache(cache_path)
+        if compiled is not None:
+            def _validate_fast(data, _compiled=compiled):
+                try:
+                    _compiled(data)
+                except fastjsonschema.JsonSchemaException as exc:
+                    return [exc.message]
+                return []
+
+            return _validate_fast
+
+    jsonschema.Draft7Validator.check_schema(schema)
+    validator = jsonschema.Draft7Validator(schema)
+
+    if all_errors:
+        def _validate_slow(data, _validator=validator):
+            return [e.message for e in list(_validator.iter_errors(data))[:3]]
+
+        return _validate_slow
+
+    def _validate_first_error(data, _validator=validator):
+        try:
+            _validator.validate(data)
+        except jsonschema.ValidationError as exc:
+            return [exc.message]
+        return []
+
+    return _validate_first_error
 
 
 def canonical_bytes(data: object) -> bytes:
-    """Return json.dumps(sort_keys=True, separators=(',',':')) + b'\\n'."""
+    """Return json.dumps(sort_keys=True, separators=(',',':')) + b'\\n' as UTF-8.
+
+    Always the stdlib serializer: it defines the canonical byte format,
+    including ensure_ascii escapes and float exponent style ("caf\\u00e9",
+    "1e+16") where orjson emits raw UTF-8 and "1e16".  Serializing with
+    whichever library is installed would make a golden's pass/fail verdict
+    environment-dependent, so orjson is used for parsing only.
+    """
     return (json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n").encode(
         "utf-8"
     )
 
 
-def check_canonical(raw_bytes: bytes, rel_path: str) -> list[str]:
+def check_canonical(
+    raw_bytes: bytes,
+    rel_path: str,
+    digest: str | None = None,
+    known_canonical: frozenset[str] = frozenset(),
+) -> tuple[list[str], object | None]:
     """Compare raw_bytes against canonical_bytes(json.loads(raw_bytes)).
 
-    Returns a list of error strings (empty if the file is canonical).
+    Returns (errors, parsed_data); errors is empty if the file is canonical,
+    parsed_data is None when the bytes are not valid JSON.  Callers reuse the
+    parsed document for the schema and determinism checks so each golden is
+    parsed exactly once.
+
+    When *digest* (sha256 hex of raw_bytes) is in *known_canonical*, the
+    re-serialization is skipped — content verified canonical on an earlier
+    run cannot have become non-canonical without its hash changing.
     """
     try:
-        data = json.loads(raw_bytes)
+        data = _loads(raw_bytes)
     except json.JSONDecodeError as exc:
-        return [f"NOT_CANONICAL: JSON parse error in {rel_path}: {exc}"]
+        return [f"NOT_CANONICAL: JSON parse error in {rel_path}: {exc}"], None
+    # Canonical output always ends with exactly one newline; reject without
+    # paying for the re-serialization.
+    if not raw_bytes.endswith(b"\n"):
+        return [f"NOT_CANONICAL: {rel_path}"], data
+    if digest is not None and digest in known_canonical:
+        return [], data
     expected = canonical_bytes(data)
     if raw_bytes != expected:
-        return [f"NOT_CANONICAL: {rel_path}"]
-    return []
+        return [f"NOT_CANONICAL: {rel_path}"], data
+    return [], data
 
 
-def check_schema(data: dict, golden_name: str, schemas_dir: Path) -> list[str]:
+def check_schema(
+    data: dict,
+    golden_name: str,
+    schemas_dir: Path,
+    stem: str | None = None,
+    all_errors: bool = False,
+) -> list[str]:
     """Validate data against the schema mapped from golden_name.
 
     Returns a list of error strings (empty if valid or no schema mapping).
+    *stem* may be supplied by callers that already have it, avoiding a
+    Path construction per file.
     """
-    stem = Path(golden_name).stem  # e.g. "Script" from "Script.json"
+    if stem is None:
+        stem = Path(golden_name).stem  # e.g. "Script" from "Script.json"
     schema_file = SCHEMA_MAP.get(stem)
     if schema_file is None:
         return []  # No mapping; skip unknown goldens
 
-    schema_path = schemas_dir / schema_file
-    if not schema_path.exists():
-        return [f"SCHEMA_INVALID: {golden_name}: schema file not found: {schema_path}"]
+    cache_key = (str(schemas_dir), schema_file)
+    try:
+        schema_path = _SCHEMA_PATH_CACHE[cache_key]
+    except KeyError:
+        schema_path = schemas_dir / schema_file
+        if not schema_path.exists():
+            schema_path = None
+        _SCHEMA_PATH_CACHE[cache_key] = schema_path
+    if schema_path is None:
+        return [
+            f"SCHEMA_INVALID: {golden_name}: schema file not found:"
+            f" {schemas_dir / schema_file}"
+        ]
 
     try:
-        schema = json.loads(schema_path.read_bytes())
-        validator = jsonschema.Draft7Validator(schema)
-        errs = list(validator.iter_errors(data))
-        if errs:
-            msgs = "; ".join(e.message for e in errs[:3])
-            return [f"SCHEMA_INVALID: {golden_name}: {msgs}"]
+        cache_key = (schema_file, all_errors)
+        validate = _VALIDATOR_CACHE.get(cache_key)
+        if validate is None:
+            validate = _build_validator(schema_path, all_errors)
+            _VALIDATOR_CACHE[cache_key] = validate
+        msgs = validate(data)
+        if msgs:
+            return [f"SCHEMA_INVALID: {golden_name}: {'; '.join(msgs)}"]
     except Exception as exc:  # noqa: BLE001
         return [f"SCHEMA_INVALID: {golden_name}: {exc}"]
 
     return []
 
 
+class _StopWalk(Exception):
+    """Unwinds the determinism walk after the first recorded violation."""
+
+
 def _check_string_value(
     value: str,
     key: str,
     rel_path: str,
     errors: list[str],
+    fail_fast: bool = False,
 ) -> None:
-    """Append an error if *value* is non-deterministic."""
-    if _RE_DATETIME.match(value) and value != _EPOCH_SENTINEL:
-        errors.append(
-            f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains datetime: {value!r}"
-        )
-    elif _RE_UUID.match(value):
-        errors.append(
-            f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains UUID: {value!r}"
-        )
-    elif _RE_FILE_URI.match(value) and not _RE_FILE_URI_ALLOWED.match(value):
-        errors.append(
-            f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains file URI: {value!r}"
-        )
-    elif _RE_ABS_PATH.match(value):
+    """Append an error if *value* is non-deterministic.
+
+    Dispatches on the first character (see pattern comments above); branch
+    order within each prefix class preserves the original datetime → UUID →
+    file URI → absolute path precedence.  With *fail_fast*, raises _StopWalk
+    after recording the first violation so callers can stop traversing.
+    """
+    if not value:
+        return
+    n_before = len(errors)
+    c = value[0]
+    if "0" <= c <= "9":
+        if _RE_DATETIME.match(value):
+            if value != _EPOCH_SENTINEL:
+                errors.append(
+                    f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains"
+                    f" datetime: {value!r}"
+                )
+        elif len(value) == 36 and value[8] == "-" and _RE_UUID.match(value):
+            errors.append(
+                f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains UUID:"
+                f" {value!r}"
+            )
+    elif "a" <= c <= "f":
+        if len(value) == 36 and value[8] == "-" and _RE_UUID.match(value):
+            errors.append(
+                f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains UUID:"
+                f" {value!r}"
+            )
+        elif (
+            c == "f"
+            and value.startswith("file:///")
+            and not (
+                value.startswith("file:///placeholder")
+                and (len(value) == 19 or value[19] == "/")
+            )
+        ):
+            errors.append(
+                f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains file URI:"
+                f" {value!r}"
+            )
+    elif c == "/":
+        if len(value) > 1 and "a" <= value[1] <= "z":
+            errors.append(
+                f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains absolute"
+                f" path: {value!r}"
+            )
+    elif "A" <= c <= "Z" and value[1:3] == ":\\":
         errors.append(
-            f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains absolute path:"
-            f" {value!r}"
+            f"NON_DETERMINISTIC: {rel_path}: field '{key}' contains absolute"
+            f" path: {value!r}"
         )
+    if fail_fast and len(errors) > n_before:
+        raise _StopWalk
 
 
 def _walk_values(
     data: object,
     current_key: str,
-    allowlist_schema: dict,
+    allowed: frozenset[str],
     errors: list[str],
     rel_path: str,
+    fail_fast: bool = False,
 ) -> None:
-    """Recursively walk all string values in *data*."""
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if isinstance(v, str):
-                if k not in allowlist_schema:
-                    _check_string_value(v, k, rel_path, errors)
-            elif isinstance(v, (dict, list)):
-                _walk_values(v, k, allowlist_schema, errors, rel_path)
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, str):
-                if current_key not in allowlist_schema:
-                    _check_string_value(item, current_key, rel_path, errors)
-            elif isinstance(item, (dict, list)):
-                _walk_values(item, current_key, allowlist_schema, errors, rel_path)
-
-
-def check_determinism(data: dict, golden_name: str, allowlist: dict) -> list[str]:
+    """Walk all string values in *data* with an explicit stack.
+
+    Iterative rather than recursive: no Python frame per nested container
+    and no recursion-depth limit.  Exact type checks are safe here because
+    json.loads only ever produces plain dict/list/str.
+    """
+    stack = [(data, current_key)] if type(data) in (dict, list) else []
+    while stack:
+        node, ckey = stack.pop()
+        if type(node) is dict:
+            for k, v in node.items():
+                if type(v) is str:
+                    if k not in allowed:
+                        _check_string_value(v, k, rel_path, errors, fail_fast)
+                elif type(v) is dict or type(v) is list:
+                    stack.append((v, k))
+        else:  # list — only dicts and lists are ever pushed
+            for item in node:
+                if type(item) is str:
+                    if ckey not in allowed:
+                        _check_string_value(item, ckey, rel_path, errors, fail_fast)
+                elif type(item) is dict or type(item) is list:
+                    stack.append((item, ckey))
+
+
+def check_determinism(
+    data: dict,
+    golden_name: str,
+    allowlist: dict,
+    stem: str | None = None,
+    fail_fast: bool = False,
+    canonical_blob: bytes | None = None,
+) -> list[str]:
     """Walk all string values; flag ISO datetimes (not epoch), UUIDs, real abs paths.
 
     Returns a list of error strings (empty if all values are deterministic).
+    *stem* may be supplied by callers that already have it, avoiding a
+    Path construction per file.  With *fail_fast*, the walk stops at the
+    first violation instead of traversing the rest of the document.
+    *canonical_blob*, when supplied, must be the verified-canonical byte form
+    of *data*; one regex scan over it rules out clean documents without
+    walking them.
     """
-    stem = Path(golden_name).stem  # e.g. "ShotList" from "ShotList.json"
-    allowlist_schema: dict = allowlist.get(stem, {})
+    if canonical_blob is not None and _RE_BLOB_CANDIDATES.search(canonical_blob) is None:
+        return []
+    if stem is None:
+        stem = Path(golden_name).stem  # e.g. "ShotList" from "ShotList.json"
+    allowed: frozenset[str] = frozenset(allowlist.get(stem, ()))
     errors: list[str] = []
-    _walk_values(data, "", allowlist_schema, errors, golden_name)
+    try:
+        _walk_values(data, "", allowed, errors, golden_name, fail_fast)
+    except _StopWalk:
+        pass  # the triggering error is already in *errors*
     return errors
 
 
-def run_checks(contracts_dir: Path) -> tuple[list[str], int]:
+# Below this many goldens, process spawn overhead outweighs the parallel win
+# and the files are checked serially in-process.
+_PARALLEL_THRESHOLD = 64
+
+# Per-task arguments shared by every golden in a parallel run, seeded once
+# per worker by _init_worker (via ProcessPoolExecutor initargs) so the pool
+# pickles them per worker instead of per task.
+_WORKER_ARGS: tuple | None = None
+
+
+def _init_worker(
+    contracts_dir: Path,
+    schemas_dir: Path,
+    allowlist: dict,
+    known_canonical: frozenset[str],
+    fail_fast: bool,
+    all_errors: bool,
+) -> None:
+    """Stash the run-wide _check_one arguments in the worker process."""
+    global _WORKER_ARGS
+    _WORKER_ARGS = (
+        contracts_dir, schemas_dir, allowlist, known_canonical, fail_fast, all_errors
+    )
+
+
+def _check_one_task(golden_path: Path) -> tuple[str, list[str], str | None]:
+    """Pool entry point: _check_one against the worker's seeded arguments."""
+    return _check_one(golden_path, *_WORKER_ARGS)
+
+
+def _iter_goldens(root: Path) -> list[Path]:
+    """Collect all *.json files under *root*, sorted.
+
+    Walks with os.scandir, which reuses the dirent data from a single
+    getdents call per directory instead of pathlib.rglob's per-entry Path
+    construction and stat-based type checks.
+    """
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    found.append(entry.path)
+    found.sort()
+    return [Path(p) for p in found]
+
+
+def _check_one(
+    golden_path: Path,
+    contracts_dir: Path,
+    schemas_dir: Path,
+    allowlist: dict,
+    known_canonical: frozenset[str] = frozenset(),
+    fail_fast: bool = False,
+    all_errors: bool = False,
+) -> tuple[str, list[str], str | None]:
+    """Run all three checks against one golden.
+
+    Returns (rel_path, errors, digest); digest is the sha256 of the file
+    content when it verified canonical (for the canonical cache), else None.
+
+    Top-level so ProcessPoolExecutor can pickle it; the per-schema validator
+    cache warms up independently inside each worker process.
+    """
+    rel_path = str(golden_path.relative_to(contracts_dir))
+    raw_bytes = golden_path.read_bytes()
+    digest = hashlib.sha256(raw_bytes).hexdigest()
+
+    # Check 1: canonical format (also yields the parsed document)
+    file_errors, data = check_canonical(raw_bytes, rel_path, digest, known_canonical)
+    canonical_digest = digest if not file_errors else None
+    if data is None:
+        return rel_path, file_errors, canonical_digest
+
+    # Checks 2 and 3: schema validation and determinism, sharing one stem
+    stem = golden_path.stem
+    file_errors.extend(
+        check_schema(data, golden_path.name, schemas_dir, stem, all_errors)
+    )
+    # The blob prefilter is only sound when raw_bytes is the canonical form
+    # (non-canonical files may escape-encode characters the patterns expect).
+    blob = raw_bytes if canonical_digest is not None else None
+    file_errors.extend(
+        check_determinism(data, golden_path.name, allowlist, stem, fail_fast, blob)
+    )
+
+    return rel_path, file_errors, canonical_digest
+
+
+def run_checks(
+    contracts_dir: Path, fail_fast: bool = False, all_errors: bool = False
+) -> tuple[list[str], int]:
     """Discover all goldens/**/*.json, run all 3 checks, return (errors, golden_count).
 
     Also prints per-golden PASS/FAIL lines followed by a summary header.
@@ -167,62 +521,90 @@ def run_checks(contracts_dir: Path) -> tuple[list[str], int]:
     # Load allowlist (best-effort)
     allowlist_path = compat_dir / "field_allowlist.json"
     if allowlist_path.exists():
-        allowlist: dict = json.loads(allowlist_path.read_bytes())
+        allowlist: dict = _loads(allowlist_path.read_bytes())
     else:
         allowlist = {}
 
-    all_errors: list[str] = []
-    results: list[tuple[str, list[str]]] = []
+    errors: list[str] = []
+    # Report lines accumulate here and go out in one sys.stdout.write at the
+    # end; print() per golden pays a lock acquisition and a write syscall
+    # each, which adds up under CI log capture.
+    report: list[str] = []
 
     # Check 0: protocol_version.json must be present
     protocol_version_path = compat_dir / "protocol_version.json"
     if not protocol_version_path.exists():
         pv_error = "MISSING: compat/protocol_version.json"
-        all_errors.append(pv_error)
-        print(f"FAIL   {pv_error}")
+        errors.append(pv_error)
+        report.append(f"FAIL   {pv_error}")
 
     if not goldens_dir.exists():
-        return all_errors, 0
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
+        return errors, 0
 
     # Collect all goldens
-    golden_paths = sorted(goldens_dir.rglob("*.json"))
+    golden_paths = _iter_goldens(goldens_dir)
     golden_count = len(golden_paths)
 
-    for golden_path in golden_paths:
-        rel_path = str(golden_path.relative_to(contracts_dir))
-        raw_bytes = golden_path.read_bytes()
-        file_errors: list[str] = []
-
-        # Check 1: canonical format
-        file_errors.extend(check_canonical(raw_bytes, rel_path))
-
-        # Parse JSON for subsequent checks
+    # Content previously verified canonical (keyed by sha256) skips the
+    # re-serialization; stale entries age out because hashes change with
+    # content.  Best-effort on both read and write.
+    cache_path = contracts_dir / ".canonical_cache.json"
+    try:
+        known_canonical = frozenset(_loads(cache_path.read_bytes()))
+    except (OSError, json.JSONDecodeError):
+        known_canonical = frozenset()
+
+    # Goldens are independent, so large sets fan out across cores;
+    # executor.map preserves the sorted order for the report below.
+    if golden_count >= _PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        shared = (
+            contracts_dir, schemas_dir, allowlist, known_canonical, fail_fast, all_errors
+        )
+        with ProcessPoolExecutor(
+            initializer=_init_worker, initargs=shared
+        ) as executor:
+            results = list(
+                executor.map(_check_one_task, golden_paths, chunksize=8)
+            )
+    else:
+        results = [
+            _check_one(
+                p,
+                contracts_dir,
+                schemas_dir,
+                allowlist,
+                known_canonical,
+                fail_fast,
+                all_errors,
+            )
+            for p in golden_paths
+        ]
+
+    canonical_digests = set()
+    for _rel_path, file_errors, digest in results:
+        errors.extend(file_errors)
+        if digest is not None:
+            canonical_digests.add(digest)
+
+    if canonical_digests != set(known_canonical):
         try:
-            data = json.loads(raw_bytes)
-        except json.JSONDecodeError:
-            results.append((rel_path, file_errors))
-            all_errors.extend(file_errors)
-            continue
+            cache_path.write_bytes(canonical_bytes(sorted(canonical_digests)))
+        except OSError:
+            pass  # read-only checkout; the cache is purely an accelerator
 
-        # Check 2: schema validation
-        file_errors.extend(check_schema(data, golden_path.name, schemas_dir))
-
-        # Check 3: determinism
-        file_errors.extend(check_determinism(data, golden_path.name, allowlist))
-
-        results.append((rel_path, file_errors))
-        all_errors.extend(file_errors)
-
-    # Print summary header then per-file results
-    print(f"Contracts verified: {golden_count} goldens")
-    for rel_path, file_errors in results:
+    # Summary header then per-file results, flushed in a single write
+    report.append(f"Contracts verified: {golden_count} goldens")
+    for rel_path, file_errors, _digest in results:
         if file_errors:
             for err in file_errors:
-                print(f"FAIL   {rel_path}: {err}")
+                report.append(f"FAIL   {rel_path}: {err}")
         else:
-            print(f"PASS   {rel_path}")
+            report.append(f"PASS   {rel_path}")
+    sys.stdout.write("\n".join(report) + "\n")
 
-    return all_errors, golden_count
+    return errors, golden_count
 
 
 def main() -> None:
@@ -236,9 +618,22 @@ def main() -> None:
         default=CONTRACTS_DIR,
         help="Path to contracts directory (default: auto-detected from script location)",
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop the determinism walk at the first violation per golden",
+    )
+    parser.add_argument(
+        "--all-errors",
+        action="store_true",
+        help="Collect up to three schema errors per golden on the jsonschema"
+        " fallback path (default aborts at the first error)",
+    )
     args = parser.parse_args()
 
-    errors, count = run_checks(args.contracts_dir)
+    errors, count = run_checks(
+        args.contracts_dir, fail_fast=args.fail_fast, all_errors=args.all_errors
+    )
 
     failed = len([e for e in errors])
     if errors: